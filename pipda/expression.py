@@ -55,6 +55,9 @@ OPERATORS = {
 class Expression(ABC):
     """The abstract Expression class"""
 
+    # Keep the expressions weak-referenceable
+    __slots__ = ("__weakref__",)
+
     _pipda_operator = None
 
     def _pipda_array_ufunc(
@@ -111,9 +114,8 @@ class Expression(ABC):
             **kwargs,
         )
 
-    def __hash__(self) -> int:
-        """Make it hashable"""
-        return hash(id(self))
+    # Make it hashable, since __eq__ is overloaded
+    __hash__ = object.__hash__
 
     def __getattr__(self, name: str) -> ReferenceAttr:
         """Whenever `expr.attr` is encountered,
@@ -1,15 +1,18 @@
 from __future__ import annotations
 
 import warnings
-from collections import OrderedDict
+from abc import get_cache_token
+from enum import Enum
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Type
 from types import MappingProxyType
-from functools import singledispatch, update_wrapper
+from functools import update_wrapper
+from weakref import WeakKeyDictionary
 
 from .utils import (
     DEFAULT_BACKEND,
     MultiImplementationsWarning,
     TypeHolder,
+    cache_clearing_singledispatch,
     evaluate_expr,
     update_user_wrapper,
     has_expr,
@@ -31,6 +34,13 @@ class FunctionCall(Expression):
         kwargs: The arguments for the function
     """
 
+    __slots__ = (
+        "_pipda_func",
+        "_pipda_args",
+        "_pipda_kwargs",
+        "_pipda_backend",
+    )
+
     def __init__(
         self,
         func: Callable | Expression,
@@ -79,20 +89,22 @@ class FunctionCall(Expression):
             impl = func.dispatch(dt.__class__, backend=self._pipda_backend)
             ctx, kw_ctx = func.get_context(impl, context)
             ctx = ctx or context
-            kw_ctx = kw_ctx or {}
             args = (
                 dt,
                 *(evaluate_expr(arg, dt, ctx) for arg in args[1:]),
             )
-            kwargs = {
-                key: evaluate_expr(val, dt, kw_ctx.get(key, ctx))
-                for key, val in kwargs.items()
-            }
+            if kw_ctx:
+                kwargs = {
+                    key: evaluate_expr(val, dt, kw_ctx.get(key, ctx))
+                    for key, val in kwargs.items()
+                }
+            else:
+                kwargs = {
+                    key: evaluate_expr(val, dt, ctx)
+                    for key, val in kwargs.items()
+                }
         else:
-            args = tuple(
-                evaluate_expr(arg, data, context)
-                for arg in args
-            )
+            args = [evaluate_expr(arg, data, context) for arg in args]
             kwargs = {
                 key: evaluate_expr(val, data, context)
                 for key, val in kwargs.items()
@@ -199,6 +211,10 @@ def register_func(
         # make sure the flags are correct
         dispatchable = pipeable = False
 
+    if isinstance(context, Enum):
+        # Resolve it once here, instead of every time the function is called
+        context = context.value
+
     def _backend_generic(*args, **kwargs):  # pyright: ignore
         raise NotImplementedError(
             f"`{wrapper.__name__}` is not implemented by the given backend."
@@ -207,23 +223,27 @@ def register_func(
     if not isinstance(cls, (list, tuple, set)) and cls is not TypeHolder:
         cls = (cls,)  # type: ignore
 
+    # backend => {cl => implementation}, weakly keyed by cl as
+    # singledispatch does. Cleared whenever an implementation is registered
+    # or the ABC cache token changes (i.e. a virtual subclass is registered)
+    dispatched: Dict[str, WeakKeyDictionary] = {}
+    cache_token = None
+
     if dispatchable:
-        registry = OrderedDict(
-            {
-                DEFAULT_BACKEND: singledispatch(
-                    func if cls is TypeHolder else _backend_generic
-                )
-            }
-        )
+        registry = {
+            DEFAULT_BACKEND: cache_clearing_singledispatch(
+                func if cls is TypeHolder else _backend_generic,
+                dispatched,
+            )
+        }
     else:
-        registry = OrderedDict({DEFAULT_BACKEND: func})  # type: ignore
+        registry = {DEFAULT_BACKEND: func}  # type: ignore
     # backend => implementation
     favorables: Dict[str, Callable] = {}
+    # Used by the implementations registered without contexts
+    default_contexts = (context, kw_context)
     contexts = {
-        (func if cls is TypeHolder else _backend_generic): (
-            context,
-            kw_context,
-        )
+        (func if cls is TypeHolder else _backend_generic): default_contexts
     }
 
     def dispatch(*clses, backend=None):
@@ -237,6 +257,10 @@ def register_func(
 
         The first cls can be dispatched is used.
 
+        The results are cached by `(cls, backend)` when a single cls is
+        given, except for the ambiguous ones, so that the warning is shown
+        every time.
+
         Args:
             clses: The types to dispatch
             backend: The backend to dispatch
@@ -247,6 +271,23 @@ def register_func(
         if not clses:
             clses = (type(None),)
 
+        nonlocal cache_token
+        # A tuple of classes can't be weakly referenced, so the results
+        # of multi-class dispatches are not cached
+        cache = None
+        if len(clses) == 1:
+            token = get_cache_token()
+            if cache_token != token:
+                dispatched.clear()
+                cache_token = token
+
+            key = clses[0]
+            try:
+                return dispatched[backend][key]
+            except KeyError:
+                pass
+            cache = dispatched.setdefault(backend, WeakKeyDictionary())
+
         if backend is not None:
             try:
                 reg = registry[backend]
@@ -257,13 +298,19 @@ def register_func(
                 )
 
             if not dispatchable:
+                if cache is not None:
+                    cache[key] = reg
                 return reg
 
             for cl in clses:
                 fun = reg.dispatch(cl)
                 # Any impl found
                 if fun is not _backend_generic:
+                    if cache is not None:
+                        cache[key] = fun
                     return fun
+            if cache is not None:
+                cache[key] = _backend_generic
             return _backend_generic
 
         impls = []
@@ -317,6 +364,8 @@ def register_func(
 
         if not impls:
             fn = func if cls is TypeHolder else _backend_generic
+            if cache is not None:
+                cache[key] = fn
             return fn
 
         if len(impls) > 1:
@@ -327,6 +376,8 @@ def register_func(
                 "`__backend=<backend>` to specify a backend.",
                 MultiImplementationsWarning,
             )
+        elif cache is not None:
+            cache[key] = impls[0][1]
 
         return impls[0][1]
 
@@ -336,8 +387,13 @@ def register_func(
         numpy ufuncs may not be able to set an attribute, so we need to
         use a dict to store the context.
         """
-        out = contexts.get(impl, (context, kw_context))
-        return (default, out[1]) if out[0] is None else out
+        out = contexts.get(impl, default_contexts)
+        if out[0] is not None:
+            return out
+
+        if isinstance(default, Enum):
+            default = default.value
+        return default, out[1]
 
     def register(
         cls=None,
@@ -387,7 +443,10 @@ def register_func(
             registry[backend] = func
         else:
             if backend not in registry:
-                registry[backend] = singledispatch(_backend_generic)
+                registry[backend] = cache_clearing_singledispatch(
+                    _backend_generic,
+                    dispatched,
+                )
 
             if isinstance(cls, (tuple, list, set)):
                 for c in cls:
@@ -397,8 +456,11 @@ def register_func(
 
         if favored:
             favorables[backend] = func
+        if isinstance(context, Enum):
+            context = context.value
         if context is not None or kw_context is not None:
             contexts[func] = context, kw_context
+        dispatched.clear()
         if overwrite_doc:
             wrapper.__doc__ = func.__doc__
         return func
@@ -409,7 +471,10 @@ def register_func(
             return dispatch(backend=backend)(*args, **kwargs)
 
         if pipeable:
-            ast_fb = kwargs.pop("__ast_fallback", wrapper.ast_fallback)
+            if "__ast_fallback" in kwargs:
+                ast_fb = kwargs.pop("__ast_fallback")
+            else:
+                ast_fb = wrapper.ast_fallback
 
             if is_piping(wrapper.__name__, ast_fb):
                 from .verb import VerbCall
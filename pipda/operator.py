@@ -20,6 +20,8 @@ class OperatorCall(Expression):
         operands: The operands of the operator
     """
 
+    __slots__ = ("_pipda_op_func", "_pipda_op_name", "_pipda_operands")
+
     def __init__(
         self, op_func: Callable, op_name: str, *operands: Any
     ) -> None:
@@ -45,10 +47,10 @@ class OperatorCall(Expression):
         context: ContextType = None,
     ) -> Any:
         """Evaluate the operator call"""
-        operands = (
+        operands = [
             evaluate_expr(arg, data, context)
             for arg in self._pipda_operands
-        )
+        ]
         return self._pipda_op_func(*operands)
 
 
@@ -72,8 +74,8 @@ class Operator:
             # not a right operator (e.g. radd)
             return getattr(operator, name)
 
-        name = name[1:]
-        return lambda x, y: getattr(operator, name)(y, x)
+        op_func = getattr(operator, name[1:])
+        return lambda x, y: op_func(y, x)
 
 
 def register_operator(opclass: Type) -> Type:
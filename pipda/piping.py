@@ -28,6 +28,8 @@ class PipeableCall(Expression, ABC):
 
     >>> data >> pipeable_call(...)
     """
+    __slots__ = ()
+
     PIPING: str = None
 
 
@@ -20,6 +20,8 @@ class Reference(Expression, ABC):
         ref: The reference. For example: `B` for `f.A.B`
     """
 
+    __slots__ = ("_pipda_parent", "_pipda_ref", "_pipda_level")
+
     def __init__(self, parent: Any, ref: Any) -> None:
         self._pipda_parent = parent
         self._pipda_ref = ref
@@ -43,6 +45,8 @@ class Reference(Expression, ABC):
 class ReferenceAttr(Reference):
     """Attribute references, for example: `f.A`, `f.A.B` etc."""
 
+    __slots__ = ()
+
     def __str__(self) -> str:
         if self._pipda_level == 1:
             return str(self._pipda_ref)
@@ -72,6 +76,8 @@ class ReferenceAttr(Reference):
 class ReferenceItem(Reference):
     """Subscript references, for example: `f['A']`, `f.A['B']` etc"""
 
+    __slots__ = ()
+
     def __str__(self) -> str:
         # stringify slice
         if isinstance(self._pipda_ref, slice):
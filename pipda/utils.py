@@ -5,13 +5,27 @@ import ast
 import sys
 from enum import Enum
 from functools import singledispatch
-from typing import Any, Callable
+from types import CodeType
+from typing import Any, Callable, Dict, Optional, Tuple, Type
 import warnings
 
-from .context import ContextType
+from .context import ContextBase, ContextType
 
 DEFAULT_BACKEND = "_default"
 
+# (code object, its id, bytecode offset) => class of the binary operator
+# that the call at that call site is the right operand of, or None if it is
+# not. Code objects compare by value regardless of their source file, so the
+# id is needed to tell the call sites apart, as executing does.
+# Not bounded, just like executing's own cache of the same call sites, which
+# keeps the same code objects and their AST nodes alive anyway
+_CALLING_OPS: Dict[
+    Tuple[CodeType, int, int],
+    Optional[Type[ast.operator]],
+] = {}
+# Placeholder for the call sites not resolved yet
+_UNRESOLVED = object()
+
 
 class PipeableCallCheckWarning(Warning):
     """Warns when checking verb is called normally or using piping"""
@@ -46,6 +60,33 @@ def update_user_wrapper(
         x.__module__ = module
 
 
+def cache_clearing_singledispatch(func: Callable, cache: Dict) -> Callable:
+    """A singledispatch function that also clears the given cache when
+    implementations are registered to it directly, for example,
+    `verb.registry[backend].register(...)`
+
+    Args:
+        func: The generic function
+        cache: The cache of the dispatch results to clear
+
+    Returns:
+        The singledispatch function
+    """
+    generic = singledispatch(func)
+    _register = generic.register
+
+    def register(cls, func=None):
+        out = _register(cls, func)
+        cache.clear()
+        if func is None and out is not cls:
+            # register(cls) used as a decorator
+            return lambda fn: register(cls, fn)
+        return out
+
+    generic.register = register  # type: ignore
+    return generic
+
+
 def is_piping(pipeable: str, fallback: str) -> bool:
     """Check if the pipeable is called with piping.
 
@@ -68,45 +109,48 @@ def is_piping(pipeable: str, fallback: str) -> bool:
     from executing import Source
     from .piping import PIPING_OPS, PipeableCall
 
-    # Caching?
     frame = sys._getframe(2)
-    node = Source.executing(frame).node
-
-    if not node:
-        # Using fallbacks
-        if fallback == "normal":
-            return False
-        if fallback == "piping":
-            return True
-        if fallback == "normal_warning":
-            warnings.warn(
-                f"Failed to detect AST node calling `{pipeable}`, "
-                "assuming a normal call.",
-                PipeableCallCheckWarning,
+    # The bytecode offset identifies the call site, and so the operator
+    key = (frame.f_code, id(frame.f_code), frame.f_lasti)
+    op = _CALLING_OPS.get(key, _UNRESOLVED)
+    if op is _UNRESOLVED:
+        node = Source.executing(frame).node
+        if not node:
+            # Using fallbacks
+            if fallback == "normal":
+                return False
+            if fallback == "piping":
+                return True
+            if fallback == "normal_warning":
+                warnings.warn(
+                    f"Failed to detect AST node calling `{pipeable}`, "
+                    "assuming a normal call.",
+                    PipeableCallCheckWarning,
+                )
+                return False
+            if fallback == "piping_warning":
+                warnings.warn(
+                    f"Failed to detect AST node calling `{pipeable}`, "
+                    "assuming a piping call.",
+                    PipeableCallCheckWarning,
+                )
+                return True
+
+            raise PipeableCallCheckError(
+                f"Failed to detect AST node calling `{pipeable}` "
+                "without a fallback solution."
             )
-            return False
-        if fallback == "piping_warning":
-            warnings.warn(
-                f"Failed to detect AST node calling `{pipeable}`, "
-                "assuming a piping call.",
-                PipeableCallCheckWarning,
-            )
-            return True
 
-        raise PipeableCallCheckError(
-            f"Failed to detect AST node calling `{pipeable}` "
-            "without a fallback solution."
-        )
+        op = None
+        parent = getattr(node, "parent", None)
+        if isinstance(parent, ast.BinOp) and parent.right is node:
+            op = parent.op.__class__
+        elif isinstance(parent, ast.AugAssign) and parent.value is node:
+            op = parent.op.__class__
 
-    try:
-        parent = node.parent
-    except AttributeError:  # pragma: no cover
-        return False
+        _CALLING_OPS[key] = op
 
-    return (
-        (isinstance(parent, ast.BinOp) and parent.right is node)
-        or (isinstance(parent, ast.AugAssign) and parent.value is node)
-    ) and isinstance(parent.op, PIPING_OPS[PipeableCall.PIPING][1])
+    return op is PIPING_OPS[PipeableCall.PIPING][1]
 
 
 def evaluate_expr(
@@ -118,6 +162,15 @@ def evaluate_expr(
     if isinstance(context, Enum):
         context = context.value
 
+    return _evaluate_expr(expr, data, context)
+
+
+def _evaluate_expr(expr: Any, data: Any, context: ContextBase) -> Any:
+    """Evaluate a mixed expression with an unwrapped context
+
+    The context is not checked again while recursing into the
+    containers.
+    """
     if hasattr(expr.__class__, "_pipda_eval"):
         # Not only for Expression objects, but also
         # allow customized classes
@@ -126,20 +179,20 @@ def evaluate_expr(
     if isinstance(expr, (tuple, list, set)):
         # In case it's subclass
         return expr.__class__(
-            (evaluate_expr(elem, data, context) for elem in expr)
+            (_evaluate_expr(elem, data, context) for elem in expr)
         )
 
     if isinstance(expr, slice):
         return slice(
-            evaluate_expr(expr.start, data, context),
-            evaluate_expr(expr.stop, data, context),
-            evaluate_expr(expr.step, data, context),
+            _evaluate_expr(expr.start, data, context),
+            _evaluate_expr(expr.stop, data, context),
+            _evaluate_expr(expr.step, data, context),
         )
 
     if isinstance(expr, dict):
         return expr.__class__(
             {
-                key: evaluate_expr(val, data, context)
+                key: _evaluate_expr(val, data, context)
                 for key, val in expr.items()
             }
         )
@@ -1,22 +1,25 @@
 from __future__ import annotations
 
 import warnings
+from abc import get_cache_token
 from enum import Enum
-from collections import OrderedDict
 from types import MappingProxyType
 from typing import Any, Callable, Dict, List, Type, Sequence
-from functools import singledispatch, update_wrapper
+from functools import update_wrapper
+from weakref import WeakKeyDictionary
 
 from .utils import (
     DEFAULT_BACKEND,
     MultiImplementationsWarning,
     TypeHolder,
+    cache_clearing_singledispatch,
     evaluate_expr,
     has_expr,
     update_user_wrapper,
     is_piping,
 )
 from .context import ContextPending, ContextType
+from .function import FunctionCall
 from .piping import PipeableCall
 
 
@@ -29,6 +32,13 @@ class VerbCall(PipeableCall):
         kwargs: The arguments for the verb
     """
 
+    __slots__ = (
+        "_pipda_func",
+        "_pipda_args",
+        "_pipda_kwargs",
+        "_pipda_backend",
+    )
+
     def __init__(
         self,
         func: Callable,
@@ -41,18 +51,14 @@ class VerbCall(PipeableCall):
         self._pipda_backend = kwargs.pop("__backend", None)
 
     def __str__(self) -> str:
-        strargs: List[str] = []
-        if not getattr(self._pipda_func, "dependent", False):
-            strargs.append(".")
-
-        funname = self._pipda_func.__name__
-        if self._pipda_args:
-            strargs.extend((str(arg) for arg in self._pipda_args))
-        if self._pipda_kwargs:
-            strargs.extend(
-                f"{key}={val}" for key, val in self._pipda_kwargs.items()
-            )
-        return f"{funname}({', '.join(strargs)})"
+        strargs: List[str] = (
+            [] if getattr(self._pipda_func, "dependent", False) else ["."]
+        )
+        strargs.extend(map(str, self._pipda_args))
+        strargs.extend(
+            f"{key}={val}" for key, val in self._pipda_kwargs.items()
+        )
+        return f"{self._pipda_func.__name__}({', '.join(strargs)})"
 
     def _pipda_eval(
         self,
@@ -65,18 +71,24 @@ class VerbCall(PipeableCall):
         )
 
         context, kw_context = self._pipda_func.get_context(func, context)
-        kw_context = kw_context or {}
 
-        if isinstance(context, Enum):
-            context = context.value
-        if isinstance(context, ContextPending):
-            return func(data, *self._pipda_args, **self._pipda_kwargs)
-
-        args = (evaluate_expr(arg, data, context) for arg in self._pipda_args)
-        kwargs = {
-            key: evaluate_expr(val, data, kw_context.get(key, context))
-            for key, val in self._pipda_kwargs.items()
-        }
+        args = self._pipda_args
+        kwargs = self._pipda_kwargs
+        if isinstance(context, ContextPending) or (not args and not kwargs):
+            # Nothing to evaluate
+            return func(data, *args, **kwargs)
+
+        args = [evaluate_expr(arg, data, context) for arg in args]
+        if kw_context:
+            kwargs = {
+                key: evaluate_expr(val, data, kw_context.get(key, context))
+                for key, val in kwargs.items()
+            }
+        else:
+            kwargs = {
+                key: evaluate_expr(val, data, context)
+                for key, val in kwargs.items()
+            }
         return func(data, *args, **kwargs)
 
 
@@ -148,6 +160,10 @@ def register_verb(
             ast_fallback=ast_fallback,
         )
 
+    if isinstance(context, Enum):
+        # Resolve it once here, instead of every time the verb is called
+        context = context.value
+
     def _backend_generic(*args, **kwargs):
         raise NotImplementedError(
             f"`{wrapper.__name__}` is not implemented by the given backend."
@@ -156,24 +172,27 @@ def register_verb(
     if not isinstance(cls, (list, tuple, set)) and cls is not TypeHolder:
         cls = (cls,)  # type: ignore
 
-    registry = OrderedDict(
-        {
-            DEFAULT_BACKEND: singledispatch(
-                func if cls is TypeHolder else _backend_generic
-            )
-        }
-    )
-    # implementation => backend
-    backends: Dict[Callable, str] = {}
+    # backend => {cl => implementation}, weakly keyed by cl as
+    # singledispatch does. Cleared whenever an implementation is registered
+    # or the ABC cache token changes (i.e. a virtual subclass is registered)
+    dispatched: Dict[str, WeakKeyDictionary] = {}
+    cache_token = None
+
+    # backend => singledispatch function, in registration order
+    registry = {
+        DEFAULT_BACKEND: cache_clearing_singledispatch(
+            func if cls is TypeHolder else _backend_generic,
+            dispatched,
+        )
+    }
     # backend => implementation
     favorables: Dict[str, Callable] = {}
     # # cannot create weak reference to 'numpy.ufunc' object
     # contexts = weakref.WeakKeyDictionary()
+    # Used by the implementations registered without contexts
+    default_contexts = (context, kw_context)
     contexts = {
-        (func if cls is TypeHolder else _backend_generic): (
-            context,
-            kw_context,
-        )
+        (func if cls is TypeHolder else _backend_generic): default_contexts
     }
 
     def dispatch(cl, backend=None):
@@ -184,7 +203,23 @@ def register_verb(
 
         if backend is not provided, we will look for the implementation of
         the backends in reverse order.
+
+        The results are cached by `(cl, backend)`, except for the ambiguous
+        ones, so that the warning is shown every time.
         """
+        nonlocal cache_token
+        token = get_cache_token()
+        if cache_token != token:
+            dispatched.clear()
+            cache_token = token
+
+        try:
+            return dispatched[backend][cl]
+        except KeyError:
+            pass
+
+        cache = dispatched.setdefault(backend, WeakKeyDictionary())
+
         if backend is not None:
             try:
                 reg = registry[backend]
@@ -193,7 +228,8 @@ def register_verb(
                     f"[{wrapper.__name__}] "
                     f"No implementations found for backend `{backend}`."
                 )
-            return reg.dispatch(cl)
+            fun = cache[cl] = reg.dispatch(cl)
+            return fun
 
         impls = []
         favored_found = False
@@ -217,11 +253,11 @@ def register_verb(
             if favorables.get(backend) is fun:
                 favored_found = True
 
-            backends[fun] = backend
             impls.append((backend, fun))
 
         if not impls:
-            return func if cls is TypeHolder else _backend_generic
+            fun = cache[cl] = func if cls is TypeHolder else _backend_generic
+            return fun
 
         if len(impls) > 1:
             warnings.warn(
@@ -231,6 +267,8 @@ def register_verb(
                 "`__backend=<backend>` to specify a backend.",
                 MultiImplementationsWarning,
             )
+        else:
+            cache[cl] = impls[0][1]
 
         return impls[0][1]
 
@@ -240,8 +278,13 @@ def register_verb(
         numpy ufuncs may not be able to set an attribute, so we need to
         use a dict to store the context.
         """
-        out = contexts.get(impl, (context, kw_context))
-        return (default, out[1]) if out[0] is None else out
+        out = contexts.get(impl, default_contexts)
+        if out[0] is not None:
+            return out
+
+        if isinstance(default, Enum):
+            default = default.value
+        return default, out[1]
 
     def register(
         cls,
@@ -265,7 +308,10 @@ def register_verb(
             )
 
         if backend not in registry:
-            registry[backend] = singledispatch(_backend_generic)
+            registry[backend] = cache_clearing_singledispatch(
+                _backend_generic,
+                dispatched,
+            )
 
         if isinstance(cls, (tuple, list, set)):
             for c in cls:
@@ -273,10 +319,13 @@ def register_verb(
         else:
             registry[backend].register(cls, func)
 
+        if isinstance(context, Enum):
+            context = context.value
         if context is not None or kw_context is not None:
             contexts[func] = context, kw_context
         if favored:
             favorables[backend] = func
+        dispatched.clear()
         if overwrite_doc:
             wrapper.__doc__ = func.__doc__
         return func
@@ -285,7 +334,11 @@ def register_verb(
         if dependent:
             return VerbCall(wrapper, *args, **kwargs)
 
-        ast_fb = kwargs.pop("__ast_fallback", wrapper.ast_fallback)
+        if "__ast_fallback" in kwargs:
+            ast_fb = kwargs.pop("__ast_fallback")
+        else:
+            ast_fb = wrapper.ast_fallback
+
         if is_piping(wrapper.__name__, ast_fb):
             return VerbCall(wrapper, *args, **kwargs)
 
@@ -296,8 +349,6 @@ def register_verb(
 
         data, *args = args
         if has_expr(data):
-            from .function import FunctionCall
-
             return FunctionCall(wrapper, data, *args, **kwargs)
 
         return VerbCall(wrapper, *args, **kwargs)._pipda_eval(data)
@@ -21,8 +21,13 @@ class Expr(Expression):
 def test_expression():
 
     f = Expr()
-    # hashable
+    # hashable by identity
     d = {f: 1}  # noqa
+    for expr in (f, f.a, f[1], f + 1):
+        assert hash(expr) == object.__hash__(expr)
+    item1, item2 = f[1], f[1]
+    d = {item1: 1, item2: 2}
+    assert len(d) == 2 and d[item1] == 1 and d[item2] == 2
     assert isinstance(f.a, ReferenceAttr)
     assert isinstance(f[1], ReferenceItem)
     assert isinstance(f + 1, OperatorCall)
@@ -1,5 +1,8 @@
+import gc
 import pytest  # noqa
 import warnings
+import weakref
+from collections.abc import Sized
 
 # from pipda.verb import register_verb
 from pipda.function import (
@@ -31,6 +34,18 @@ def test_function():
     assert call._pipda_eval(data, Context.EVAL) == 3
 
 
+def test_weakref():
+    f = Symbolic()
+
+    @register_func
+    def fn(x):
+        return x
+
+    call = fn(f.a)
+    assert isinstance(call, FunctionCall)
+    assert weakref.ref(call)() is call
+
+
 def test_refitem_as_func():
     f = Symbolic()
 
@@ -222,6 +237,84 @@ def test_backends():
         add(1.0, 2.0, __backend="back")
 
 
+def test_register_after_dispatched():
+
+    @register_func(cls=int, dispatchable=True)
+    def add(x, y):
+        return x + y
+
+    out = add(True, False)
+    assert out == 1 and isinstance(out, int)
+
+    @add.register(bool)
+    def _(x, y):
+        return x or y
+
+    out = add(True, False)
+    assert out is True
+
+    @add.register(int, backend="back")
+    def _(x, y):
+        return x * y
+
+    # ambiguous dispatches warn every time
+    for _ in range(2):
+        with pytest.warns(MultiImplementationsWarning):
+            add(1, 2)
+
+
+def test_register_to_registry_after_dispatched():
+    @register_func(cls=object, dispatchable="first")
+    def kind(x):
+        return "object"
+
+    assert kind(1) == "object"
+
+    kind.registry["_default"].register(int, lambda x: "int")
+    assert kind(1) == "int"
+    assert kind.dispatch(int) is kind.registry["_default"].dispatch(int)
+
+    @kind.registry["_default"].register(int)
+    def _(x):
+        return "int2"
+
+    assert kind(1) == "int2"
+
+
+def test_dispatch_virtual_subclass_registered_later():
+    @register_func(cls=Sized, dispatchable="first")
+    def kind(x):
+        return "sized"
+
+    @kind.register(object)
+    def _(x):
+        return "object"
+
+    class Y:
+        ...
+
+    assert kind(Y()) == "object"
+    Sized.register(Y)
+    assert kind(Y()) == "sized"
+
+
+def test_dispatch_not_retaining_classes():
+    @register_func(cls=object, dispatchable="args")
+    def names(*args):
+        return [arg.__class__.__name__ for arg in args]
+
+    refs = []
+    for i in range(3):
+        kls = type(f"Kls{i}", (), {})
+        refs.append(weakref.ref(kls))
+        assert names(kls()) == [f"Kls{i}"]
+        assert names(kls(), kls()) == [f"Kls{i}", f"Kls{i}"]
+
+    del kls
+    gc.collect()
+    assert all(ref() is None for ref in refs)
+
+
 def test_plain():
     @register_func(plain=True)
     def add0(x, y):
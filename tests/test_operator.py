@@ -1,3 +1,5 @@
+import weakref
+
 import pytest
 
 from pipda import *
@@ -20,6 +22,12 @@ def test_opcall():
     assert call._pipda_eval({"x": 2}, Context.EVAL) == 3
 
 
+def test_weakref():
+    f = Symbolic()
+    call = f.a + 1
+    assert weakref.ref(call)() is call
+
+
 def test_register_operator():
 
     f = Symbolic()
@@ -1,3 +1,6 @@
+import weakref
+from types import SimpleNamespace
+
 import pytest
 
 from pipda import *
@@ -9,6 +12,12 @@ def test_level():
     assert f.a.b._pipda_level == 2
 
 
+def test_weakref():
+    f = Symbolic()
+    for ref in (f.a, f.a.b, f["a"], f.a["b"]):
+        assert weakref.ref(ref)() is ref
+
+
 def test_cant_eval_without_context():
     f = Symbolic()
     with pytest.raises(ContextError):
@@ -27,8 +36,7 @@ def test_str():
 
 def test_attr_eval():
     f = Symbolic()
-    data = lambda: 0
-    data.x = 10
+    data = SimpleNamespace(x=10)
 
     out = f.x._pipda_eval(data, Context.EVAL)
     assert out == 10 and isinstance(out, int)
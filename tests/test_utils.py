@@ -1,5 +1,7 @@
 import pytest
+from executing import Source
 
+from pipda import utils
 from pipda import register_verb, VerbCall, Symbolic, evaluate_expr, Context
 from pipda.utils import (
     PipeableCallCheckWarning,
@@ -100,6 +102,58 @@ def test_is_piping_verbcall_raise():
     assert a == 1 and isinstance(a, int)
 
 
+def test_is_piping_caches_calling_ops(monkeypatch):
+    monkeypatch.setattr(utils, "_CALLING_OPS", {})
+    executing = Source.executing
+    calls = []
+
+    def counting_executing(cls, frame):
+        calls.append(frame.f_lasti)
+        return executing(frame)
+
+    monkeypatch.setattr(Source, "executing", classmethod(counting_executing))
+
+    @register_verb(int, ast_fallback="normal")
+    def iden(x):
+        return x
+
+    for _ in range(3):
+        out = iden(1)
+    assert out == 1
+    # The call site is only resolved once
+    assert len(calls) == 1
+    assert len(utils._CALLING_OPS) == 1
+
+    # Two call sites on the same line are resolved separately
+    a, b = iden(1), 1 >> iden()
+    assert a == 1 and b == 1
+    assert len(calls) == 3
+    assert len(set(calls)) == 3
+    assert len(utils._CALLING_OPS) == 3
+
+
+def test_is_piping_call_sites_by_code_identity(tmp_path):
+    @register_verb(int, ast_fallback="piping_warning")
+    def iden(x):
+        return x
+
+    source = "def g(v):\n    return iden(v)\n"
+    srcfile = tmp_path / "source.py"
+    srcfile.write_text(source)
+
+    ns = {"iden": iden}
+    exec(compile(source, str(srcfile), "exec"), ns)
+    out = ns["g"](1)
+    assert out == 1 and isinstance(out, int)
+
+    # Equal code object, but without the source to detect the AST node
+    ns = {"iden": iden}
+    exec(compile(source, "<nosource>", "exec"), ns)
+    with pytest.warns(PipeableCallCheckWarning):
+        out = ns["g"](1)
+    assert isinstance(out, VerbCall)
+
+
 def test_has_expr():
     f = Symbolic()
 
@@ -1,4 +1,8 @@
+import gc
 import warnings
+import weakref
+from collections.abc import Sized
+
 import pytest
 
 import numpy as np
@@ -23,6 +27,16 @@ def test_str():
     assert str(call) == "verb(., x=x)"
 
 
+def test_weakref():
+    f = Symbolic()
+
+    def verb():
+        ...
+
+    call = VerbCall(verb, f.x)
+    assert weakref.ref(call)() is call
+
+
 def test_pending_context():
     f = Symbolic()
 
@@ -61,6 +75,76 @@ def test_register_more_types():
     assert out == 20 and isinstance(out, int)
 
 
+def test_register_after_dispatched():
+    @register_verb(list)
+    def length(data):
+        return len(data)
+
+    class MyList(list):
+        ...
+
+    out = MyList([1, 2]) >> length()
+    assert out == 2 and isinstance(out, int)
+
+    @length.register(MyList)
+    def _(data):
+        return len(data) * 10
+
+    out = MyList([1, 2]) >> length()
+    assert out == 20 and isinstance(out, int)
+
+
+def test_dispatch_virtual_subclass_registered_later():
+    @register_verb(Sized)
+    def kind(data):
+        return "sized"
+
+    @kind.register(object)
+    def _(data):
+        return "object"
+
+    class X:
+        ...
+
+    assert kind(X(), __ast_fallback="normal") == "object"
+    Sized.register(X)
+    assert kind(X(), __ast_fallback="normal") == "sized"
+
+
+def test_dispatch_not_retaining_classes():
+    @register_verb(object)
+    def name(data):
+        return data.__class__.__name__
+
+    refs = []
+    for i in range(3):
+        kls = type(f"Kls{i}", (), {})
+        refs.append(weakref.ref(kls))
+        assert name(kls(), __ast_fallback="normal") == f"Kls{i}"
+
+    del kls
+    gc.collect()
+    assert all(ref() is None for ref in refs)
+
+
+def test_register_to_registry_after_dispatched():
+    @register_verb(object)
+    def kind(data):
+        return "object"
+
+    assert kind(1, __ast_fallback="normal") == "object"
+
+    kind.registry["_default"].register(int, lambda data: "int")
+    assert kind(1, __ast_fallback="normal") == "int"
+    assert kind.dispatch(int) is kind.registry["_default"].dispatch(int)
+
+    @kind.registry["_default"].register(int)
+    def _(data):
+        return "int2"
+
+    assert kind(1, __ast_fallback="normal") == "int2"
+
+
 def test_register_more_types_inherit_context():
     f = Symbolic()
 
@@ -339,3 +423,23 @@ def test_kw_context():
 
     out = {"a": 1, "b": 2, "c": 3} >> update({"b": f["a"]}, rm=f.a)
     assert out == {"b": 1, "c": 3} and isinstance(out, dict)
+
+
+def test_get_context_resolved():
+
+    @register_verb(int, context=Context.EVAL)
+    def add(x, y):
+        return x + y
+
+    impl = add.dispatch(int)
+    assert add.get_context(impl) == (Context.EVAL.value, None)
+
+    @register_verb(int)
+    def sub(x, y):
+        return x - y
+
+    impl = sub.dispatch(int)
+    assert sub.get_context(impl, Context.SELECT) == (
+        Context.SELECT.value,
+        None,
+    )